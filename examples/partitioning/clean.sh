@@ -0,0 +1,8 @@
+#!/usr/bin/env bash
+set -e -x
+
+rm -f -r sfc rcb meshfree repartitioned
+rm -f -r cache cached cached_again counts legacy knn copartitioned weighted
+rm -f fine_mesh_*.vtu coarse_mesh_*.vtu
+rm -f joined_*.vtu joined_*.stats.json
+rm -f counts.json weighted.json
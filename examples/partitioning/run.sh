@@ -0,0 +1,127 @@
+#!/usr/bin/env bash
+set -e -x
+
+# Number of points and cells of a VTU file
+count() {
+  python3 -c "import sys, vtk; r = vtk.vtkXMLUnstructuredGridReader(); r.SetFileName(sys.argv[1]); r.Update(); print(r.GetOutput().GetNumberOfPoints(), r.GetOutput().GetNumberOfCells())" "$1"
+}
+
+# Calculate franke function on fine mesh
+precice-aste-evaluate -m ../fine_mesh.vtk -f "franke3d" -d "Franke Function" -o "fine_mesh_partitioning.vtu"
+
+# Partition the mesh with the deterministic algorithms and a seeded meshfree partition written in parallel
+precice-aste-partition -m fine_mesh_partitioning.vtu -n 4 -a sfc -o fine_mesh -dir sfc
+precice-aste-partition -m fine_mesh_partitioning.vtu -n 4 -a rcb -o fine_mesh -dir rcb
+precice-aste-partition -m fine_mesh_partitioning.vtu -n 4 -a meshfree --seed 42 -j 2 -o fine_mesh -dir meshfree
+
+# Join the partitions again: streaming and in memory, reading the partitions serially and in parallel
+precice-aste-join -m sfc/fine_mesh --stream -o joined_sfc.vtu
+precice-aste-join -m rcb/fine_mesh -o joined_rcb.vtu
+precice-aste-join -m rcb/fine_mesh -j 2 -o joined_rcb_parallel.vtu
+cmp joined_rcb.vtu joined_rcb_parallel.vtu
+precice-aste-join -m meshfree/fine_mesh -o joined_meshfree.vtu
+
+# Repartition the sfc partition from 4 to 3 parts and join the result
+precice-aste-repartition -m sfc/fine_mesh -n 3 -a rcb -o fine_mesh -dir repartitioned
+precice-aste-join -m repartitioned/fine_mesh -o joined_repartitioned.vtu
+
+# Without a seed, meshfree only yields the same partition twice if the second run uses the label cache
+precice-aste-partition -m fine_mesh_partitioning.vtu -n 4 -a meshfree --cache-dir cache -o fine_mesh -dir cached
+precice-aste-partition -m fine_mesh_partitioning.vtu -n 4 -a meshfree --cache-dir cache -o fine_mesh -dir cached_again
+for rank in 0 1 2 3; do
+  cmp "cached/fine_mesh_$rank.vtu" "cached_again/fine_mesh_$rank.vtu"
+done
+precice-aste-join -m cached_again/fine_mesh -o joined_cached.vtu
+
+# Several numbers of parts from one run reuse the bisections, so 4 parts match the rcb partition
+precice-aste-partition -m fine_mesh_partitioning.vtu -n 2,4 -a rcb -o fine_mesh -dir counts --report counts.json
+for rank in 0 1 2 3; do
+  cmp "rcb/fine_mesh_$rank.vtu" "counts/4/fine_mesh_$rank.vtu"
+done
+# The report covers both partitions, all points and the discarded cells of the recovery files
+python3 - <<'PYTHON'
+import json
+
+import numpy as np
+
+report = json.load(open("counts.json"))
+assert report["phases"]
+assert sorted(report["partitions"]) == ["2", "4"]
+for numparts, quality in report["partitions"].items():
+    recovery = np.load(f"counts/{numparts}/fine_mesh_recovery.npz")
+    assert len(quality["sizes"]) == int(numparts)
+    assert sum(quality["sizes"]) == recovery["size"]
+    assert quality["discarded_cells"] == len(recovery["cell_types"])
+PYTHON
+precice-aste-join -m counts/2/fine_mesh -o joined_counts.vtu
+
+# Older versions wrote the recovery information as JSON, which can still be joined
+mkdir -p legacy
+cp sfc/fine_mesh_[0-9]*.vtu legacy/
+python3 - <<'PYTHON'
+import json
+
+import numpy as np
+
+recovery = np.load("sfc/fine_mesh_recovery.npz")
+offsets = recovery["offsets"]
+cells = np.split(recovery["connectivity"], offsets[1:-1]) if len(offsets) > 1 else []
+with open("legacy/fine_mesh_recovery.json", "w") as f:
+    json.dump(
+        {
+            "size": int(recovery["size"]),
+            "cells": [cell.tolist() for cell in cells],
+            "cell_types": recovery["cell_types"].tolist(),
+        },
+        f,
+    )
+PYTHON
+precice-aste-join -m legacy/fine_mesh -o joined_legacy.vtu
+
+# Partition the k-nearest-neighbour graph of the points with METIS
+precice-aste-partition -m fine_mesh_partitioning.vtu -n 4 -a knn -o fine_mesh -dir knn
+precice-aste-join -m knn/fine_mesh -o joined_knn.vtu
+
+# Co-partition the coarse mesh with the existing sfc partition of the fine mesh
+precice-aste-evaluate -m ../coarse_mesh.vtk -f "franke3d" -d "Franke Function" -o "coarse_mesh_partitioning.vtu"
+precice-aste-partition -m coarse_mesh_partitioning.vtu -n 4 -a sfc --reference sfc/fine_mesh -o coarse_mesh -dir copartitioned
+# Every coarse point has to be in the part of a nearest fine point
+python3 - <<'PYTHON'
+import numpy as np
+import vtk
+from scipy.spatial import cKDTree
+from vtk.util.numpy_support import vtk_to_numpy as v2n
+
+
+def read_points(filename):
+    reader = vtk.vtkXMLUnstructuredGridReader()
+    reader.SetFileName(filename)
+    reader.Update()
+    return v2n(reader.GetOutput().GetPoints().GetData())
+
+
+fine = [read_points(f"sfc/fine_mesh_{rank}.vtu") for rank in range(4)]
+nearest = cKDTree(np.concatenate(fine))
+for rank in range(4):
+    coarse = read_points(f"copartitioned/coarse_mesh_{rank}.vtu")
+    distance, _ = nearest.query(coarse)
+    rank_distance, _ = cKDTree(fine[rank]).query(coarse)
+    assert np.array_equal(distance, rank_distance), rank
+PYTHON
+precice-aste-join -m copartitioned/coarse_mesh -o joined_copartitioned.vtu
+test "$(count joined_copartitioned.vtu)" = "$(count coarse_mesh_partitioning.vtu)"
+precice-aste-evaluate -m joined_copartitioned.vtu -f "franke3d" -d difference --diffdata "Franke Function" --diff --stats --engine numpy
+python3 -c "import json, sys; sys.exit(json.load(open('joined_copartitioned.stats.json'))['abs_max'] > 1e-12)"
+
+# Balance the work of the points instead of their number, first across 2 nodes and then within each node
+precice-aste-evaluate -m fine_mesh_partitioning.vtu -f "1 + z * z" -d "Work" -o "fine_mesh_weighted.vtu"
+precice-aste-partition -m fine_mesh_weighted.vtu -n 4 --nodes 2 -a rcb --weights Work -o fine_mesh -dir weighted --report weighted.json
+python3 -c "import json, sys; sys.exit(json.load(open('weighted.json'))['partitions']['4']['imbalance'] > 0.01)"
+precice-aste-join -m weighted/fine_mesh -o joined_weighted.vtu
+
+# The joined meshes have to recover the original points, cells and data
+for mesh in joined_sfc joined_rcb joined_meshfree joined_repartitioned joined_cached joined_counts joined_legacy joined_knn joined_weighted; do
+  test "$(count "$mesh.vtu")" = "$(count fine_mesh_partitioning.vtu)"
+  precice-aste-evaluate -m "$mesh.vtu" -f "franke3d" -d difference --diffdata "Franke Function" --diff --stats --engine numpy
+  python3 -c "import json, sys; sys.exit(json.load(open('$mesh.stats.json'))['abs_max'] > 1e-12)"
+done
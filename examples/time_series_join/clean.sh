@@ -0,0 +1,6 @@
+#!/usr/bin/env bash
+set -e -x
+
+rm -f -r series
+rm -f fine_mesh_*.vtu
+rm -f joined.*.vtu step.*.vtu streamed.*.vtu
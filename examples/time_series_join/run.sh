@@ -0,0 +1,56 @@
+#!/usr/bin/env bash
+set -e -x
+
+# Partition three time steps of the fine mesh, which share the topology
+precice-aste-evaluate -m ../fine_mesh.vtk -f "franke3d" -d "Data" -o "fine_mesh_init.vtu"
+precice-aste-evaluate -m ../fine_mesh.vtk -f "x + y" -d "Data" -o "fine_mesh_dt1.vtu"
+precice-aste-evaluate -m ../fine_mesh.vtk -f "sin(x) * z" -d "Data" -o "fine_mesh_dt2.vtu"
+for step in init dt1 dt2; do
+  precice-aste-partition -m "fine_mesh_$step.vtu" -n 4 -a sfc -o "fine_mesh.$step" -dir series
+done
+
+# Join the whole time series at once and every step on its own, in memory and streamed
+precice-aste-join -m series/fine_mesh --time-series -r series/fine_mesh.init_recovery.npz -o joined.vtu
+for step in init dt1 dt2; do
+  precice-aste-join -m "series/fine_mesh.$step" -o "step.$step.vtu"
+  precice-aste-join -m "series/fine_mesh.$step" --stream -o "streamed.$step.vtu"
+done
+
+# All joins of a step have to be identical
+compare() {
+  python3 - "$@" <<'PYTHON'
+import sys
+
+import numpy as np
+import vtk
+from vtk.util.numpy_support import vtk_to_numpy as v2n
+
+
+def read(filename):
+    reader = vtk.vtkXMLUnstructuredGridReader()
+    reader.SetFileName(filename)
+    reader.Update()
+    mesh = reader.GetOutput()
+    arrays = {
+        "points": v2n(mesh.GetPoints().GetData()),
+        "connectivity": v2n(mesh.GetCells().GetConnectivityArray()),
+        "offsets": v2n(mesh.GetCells().GetOffsetsArray()),
+        "types": [mesh.GetCellType(i) for i in range(mesh.GetNumberOfCells())],
+    }
+    point_data = mesh.GetPointData()
+    for i in range(point_data.GetNumberOfArrays()):
+        arrays[point_data.GetArrayName(i)] = v2n(point_data.GetArray(i))
+    return arrays
+
+
+reference = read(sys.argv[1])
+for filename in sys.argv[2:]:
+    arrays = read(filename)
+    assert arrays.keys() == reference.keys(), filename
+    for name, array in reference.items():
+        assert np.array_equal(arrays[name], array), (filename, name)
+PYTHON
+}
+for step in init dt1 dt2; do
+  compare "step.$step.vtu" "joined.$step.vtu" "streamed.$step.vtu"
+done
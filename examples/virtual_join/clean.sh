@@ -0,0 +1,6 @@
+#!/usr/bin/env bash
+set -e -x
+
+rm -f -r partitioned
+rm -f fine_mesh_virtual.vtu
+rm -f joined.vtu joined.pvtu joined_discarded.vtu
@@ -0,0 +1,46 @@
+#!/usr/bin/env bash
+set -e -x
+
+# Calculate franke function on fine mesh
+precice-aste-evaluate -m ../fine_mesh.vtk -f "franke3d" -d "Franke Function" -o "fine_mesh_virtual.vtu"
+
+# Partition the mesh and join it in memory as well as virtually
+precice-aste-partition -m fine_mesh_virtual.vtu -n 4 -a sfc -o fine_mesh -dir partitioned
+precice-aste-join -m partitioned/fine_mesh -o joined.vtu
+precice-aste-join -m partitioned/fine_mesh --virtual -o joined.pvtu
+
+# The pieces of the virtual mesh have to contain the points, cells and data of the joined mesh
+python3 - <<'PYTHON'
+import numpy as np
+import vtk
+from vtk.util.numpy_support import vtk_to_numpy as v2n
+
+
+def read(reader, filename):
+    reader.SetFileName(filename)
+    reader.Update()
+    mesh = reader.GetOutput()
+    cells = mesh.GetCells()
+    sizes = np.diff(v2n(cells.GetOffsetsArray()))
+    connectivity = np.split(v2n(cells.GetConnectivityArray()), np.cumsum(sizes)[:-1])
+    return mesh, connectivity
+
+
+joined, joined_cells = read(vtk.vtkXMLUnstructuredGridReader(), "joined.vtu")
+virtual, virtual_cells = read(vtk.vtkXMLPUnstructuredGridReader(), "joined.pvtu")
+
+# The points of the joined mesh are in the original order
+global_ids = v2n(virtual.GetPointData().GetArray("GlobalIDs")).astype(np.int64)
+assert len(np.unique(global_ids)) == joined.GetNumberOfPoints()
+assert np.array_equal(
+    v2n(virtual.GetPoints().GetData()), v2n(joined.GetPoints().GetData())[global_ids]
+)
+for name in ["Franke Function", "GlobalIDs"]:
+    assert np.array_equal(
+        v2n(virtual.GetPointData().GetArray(name)),
+        v2n(joined.GetPointData().GetArray(name))[global_ids],
+    )
+assert sorted(tuple(sorted(global_ids[cell])) for cell in virtual_cells) == sorted(
+    tuple(sorted(cell)) for cell in joined_cells
+)
+PYTHON
@@ -251,7 +251,7 @@ def createRunScript(outdir, path, case):
         [recoveryFileLocation, tmpPrefix] = os.path.split(
             os.path.normpath(bmeshLocation)
         )
-        tmprecoveryFile = recoveryFileLocation + "/{}_recovery.json".format(bmesh)
+        tmprecoveryFile = recoveryFileLocation + "/{}_recovery.npz".format(bmesh)
         joincmd = "precice-aste-join --mesh mapped -r {} -o result.vtk".format(
             tmprecoveryFile
         )
@@ -64,27 +64,36 @@ def prepareMainMesh(meshdir, name, file, function, force=False):
     )
 
 
-def preparePartMesh(meshdir, name, p, force=False):
-
-    if p == 1:
-        return
+def preparePartMeshes(meshdir, name, partitions, force=False):
 
     mainMesh = os.path.join(meshdir, name, "1", name + ".vtu")
-    partDir = os.path.join(meshdir, name, str(p))
-    partMesh = os.path.join(partDir, name)
-    print("Preparing Mesh {} with {} paritions in {}".format(name, p, partDir))
+    counts = []
+    for p in sorted(partitions):
+        if p == 1:
+            continue
 
-    if os.path.isdir(partDir):
-        if force:
-            print("  Regenerating the partitioned mesh.")
-            shutil.rmtree(partDir)
-        else:
-            print("  Partitioned mesh already exists.")
+        partDir = os.path.join(meshdir, name, str(p))
+        print("Preparing Mesh {} with {} paritions in {}".format(name, p, partDir))
 
-            return
+        if os.path.isdir(partDir):
+            if force:
+                print("  Regenerating the partitioned mesh.")
+                shutil.rmtree(partDir)
+            else:
+                print("  Partitioned mesh already exists.")
 
-    os.makedirs(partDir, exist_ok=True)
-    [pathName, tmpfilename] = os.path.split(os.path.normpath(partMesh))
+                continue
+        counts.append(p)
+
+    if not counts:
+        return
+
+    # Partition the mesh for all counts at once, each count is stored in its own subdirectory
+    meshDir = os.path.join(meshdir, name)
+    if len(counts) == 1:
+        outDir = os.path.join(meshDir, str(counts[0]))
+    else:
+        outDir = meshDir
     subprocess.run(
         [
             "precice-aste-partition",
@@ -93,11 +102,11 @@ def preparePartMesh(meshdir, name, p, force=False):
             "--algorithm",
             "meshfree",
             "-o",
-            partMesh,
+            name,
             "--directory",
-            pathName,
+            outDir,
             "-n",
-            str(p),
+            ",".join(str(p) for p in counts),
         ]
     )
 
@@ -127,8 +136,7 @@ def main(argv):
             raise Exception(f'\033[91m Unable to open file called "{file}".\033[0m')
         prepareMainMesh(meshdir, name, file, function, args.force)
 
-        for p in partitions:
-            preparePartMesh(meshdir, name, p, args.force)
+        preparePartMeshes(meshdir, name, partitions, args.force)
 
     return 0
 